@@ -1,19 +1,18 @@
 # app.py
 import os
-import math
 import pandas as pd
 import streamlit as st
 import matplotlib.pyplot as plt
-from src.geo import haversine_m
-
 
+from src import autocomplete
 from src.config import load_settings
 from src.http_client import HttpClient
 from src.geo import miles_to_meters, generate_tile_centers
 from src.places_collector import collect_places
 from src.text_search_collector import collect_places_textsearch
-from src.reviews_collector import collect_reviews
+from src.reviews_collector import collect_reviews, parse_components
 from src.insights import add_insights
+from src.exporters import to_csv_bytes
 
 # Optional: load local .env (safe on Render too)
 try:
@@ -35,7 +34,24 @@ if not api_key:
     st.stop()
 
 settings = load_settings()
-client = HttpClient(timeout_sec=settings.timeout_sec, sleep_sec=settings.sleep_between_requests_sec)
+
+
+# One client per server process: Streamlit re-runs this script on every
+# widget change, and the keep-alive session + shared rate limiter must
+# survive those reruns (settings are fixed per process: leading _ = unhashed)
+@st.cache_resource
+def get_client(_settings) -> HttpClient:
+    return HttpClient(
+        timeout_sec=_settings.timeout_sec,
+        max_qps=_settings.max_qps,
+        burst=_settings.qps_burst,
+        pool_connections=_settings.http_pool_connections,
+        pool_maxsize=_settings.http_pool_maxsize,
+        max_retry_wait_sec=_settings.retry_after_max_sec,
+    )
+
+
+client = get_client(settings)
 
 if "run_counter" not in st.session_state:
     st.session_state.run_counter = 0
@@ -43,60 +59,48 @@ if "run_counter" not in st.session_state:
 # -------------------------
 # Helpers: Autocomplete + Resolve + Geocode
 # -------------------------
-AUTOCOMPLETE_URL = "https://maps.googleapis.com/maps/api/place/autocomplete/json"
-DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
-EARTH_RADIUS_M = 6371000.0
-
-
-def haversine_m(lat1, lon1, lat2, lon2) -> float:
-    """Distance between two coords in meters"""
-    phi1, phi2 = math.radians(lat1), math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlambda = math.radians(lon2 - lon1)
-    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
-    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
-
-
-def parse_components(address_components: list) -> dict:
-    out = {"city": None, "state": None, "zip": None, "country": None}
-    for c in address_components or []:
-        types = c.get("types", [])
-        if "locality" in types:
-            out["city"] = c.get("long_name")
-        if "administrative_area_level_1" in types:
-            out["state"] = c.get("short_name")
-        if "postal_code" in types:
-            out["zip"] = c.get("long_name")
-        if "country" in types:
-            out["country"] = c.get("short_name")
-    return out
-
-
+# Cached on their primitive args so Streamlit reruns (every widget change)
+# don't re-hit the Google APIs; client/settings are module globals.
+@st.cache_data(ttl=3600, show_spinner=False)
 def get_address_suggestions(user_input: str, limit: int = 6):
-    params = {"input": user_input, "types": "geocode", "key": settings.api_key}
-    data = client.get_json(AUTOCOMPLETE_URL, params=params)
-    preds = data.get("predictions", []) or []
-    return [{"description": p.get("description"), "place_id": p.get("place_id")} for p in preds[:limit]]
+    return autocomplete.get_address_suggestions(client, settings, user_input, limit=limit)
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def resolve_place(place_id: str) -> dict:
-    params = {"place_id": place_id, "fields": "formatted_address,address_component,geometry", "key": settings.api_key}
-    data = client.get_json(DETAILS_URL, params=params)
-    status = data.get("status")
-    if status != "OK":
-        raise RuntimeError(f"Place Details (resolve) error: status={status}, msg={data.get('error_message')}")
-    return data.get("result", {}) or {}
+    return autocomplete.get_place_formatted_address(client, settings, place_id)
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def geocode_address(address: str):
-    params = {"address": address, "key": settings.api_key}
-    data = client.get_json(settings.geocode_url, params=params)
-    status = data.get("status")
-    if status != "OK":
-        raise RuntimeError(f"Geocode error: status={status}, msg={data.get('error_message')}")
-    loc = data["results"][0]["geometry"]["location"]
-    formatted = data["results"][0].get("formatted_address")
-    return float(loc["lat"]), float(loc["lng"]), formatted
+    return autocomplete.geocode_address(client, settings, address)
+
+
+# -------------------------
+# Helpers: cached collectors (keyed on the run inputs)
+# -------------------------
+@st.cache_data(ttl=1800, show_spinner=False)
+def cached_places_nearby(tile_centers, search_radius_m: int, keyword: str, lat: float, lon: float, radius_m: float):
+    return collect_places(
+        client,
+        settings,
+        tile_centers,
+        search_radius_m,
+        keyword,
+        filter_center=(lat, lon),
+        filter_radius_m=radius_m,
+    )
+
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def cached_reviews(places):
+    return collect_reviews(client, settings, places)
+
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def csv_bytes(df: pd.DataFrame) -> bytes:
+    # Keyed on the frame's contents, so unrelated reruns don't re-serialize
+    return to_csv_bytes(df)
 
 
 # -------------------------
@@ -111,17 +115,9 @@ with col_a:
 # -------------------------
 # UI inputs
 # -------------------------
-search_mode = st.selectbox(
-    "Search Mode",
-    [
-        "B) Brand Search (Text Search) — faster, ranked results",
-        "A) Geo Coverage (Tiled Nearby Search) — slower, more geographic coverage",
-    ],
-)
-
+# Location stays outside the form so suggestions update as the address changes
+# (helpers are cached, so these reruns don't re-hit the API).
 user_input = st.text_input("City/Address", "Plano, TX")
-keyword = st.text_input("Keyword (restaurant, mcdonalds, pizza...)", "mcdonalds")
-radius_miles = st.number_input("Radius (miles)", min_value=1, max_value=200, value=10, step=1)
 
 st.caption("Tip: Type at least 3 characters to see suggestions and select the best match.")
 
@@ -148,7 +144,19 @@ if suggestions:
         except Exception as e:
             st.warning(f"Could not resolve selection. Fallback to geocode. Details: {e}")
 
-run_btn = st.button("Run Analysis")
+# Search settings only take effect on submit: editing them doesn't rerun the app
+with st.form("search"):
+    search_mode = st.selectbox(
+        "Search Mode",
+        [
+            "B) Brand Search (Text Search) — faster, ranked results",
+            "A) Geo Coverage (Tiled Nearby Search) — slower, more geographic coverage",
+        ],
+    )
+    keyword = st.text_input("Keyword (restaurant, mcdonalds, pizza...)", "mcdonalds")
+    radius_miles = st.number_input("Radius (miles)", min_value=1, max_value=200, value=10, step=1)
+
+    run_btn = st.form_submit_button("Run Analysis")
 
 # -------------------------
 # Chart helpers (responsive sizing)
@@ -228,13 +236,15 @@ if run_btn:
 
         with st.spinner("Collecting places (Text Search) + radius filtering..."):
             try:
-                places = collect_places_textsearch(
+                # collect_places_textsearch keeps its own TTL caches: no st.cache_data layer
+                found = collect_places_textsearch(
                     client,
                     settings,
                     query=query,
                     filter_center=(lat, lon),
                     filter_radius_m=user_radius_m,
                 )
+                places = pd.DataFrame([p.to_dict() for p in found])
             except Exception as e:
                 st.error(f"Text Search failed: {e}")
                 st.stop()
@@ -262,14 +272,13 @@ if run_btn:
 
         with st.spinner("Collecting places (Nearby Search tiles) + strict radius filtering..."):
             try:
-                places = collect_places(
-                    client,
-                    settings,
+                places = cached_places_nearby(
                     tile_centers,
                     search_radius_m,
                     keyword.strip(),
-                    filter_center=(lat, lon),
-                    filter_radius_m=user_radius_m,
+                    lat,
+                    lon,
+                    user_radius_m,
                 )
             except Exception as e:
                 st.error(f"Geo Coverage failed: {e}")
@@ -277,21 +286,22 @@ if run_btn:
 
         st.success(f"Places within {radius_miles:.1f} miles (Geo Coverage): {len(places)}")
 
-    if not places:
+    # Both modes yield a DataFrame here (Geo Coverage builds it column-wise)
+    if places.empty:
         st.warning("No places found within the selected radius. Try increasing radius or changing keyword.")
         st.stop()
 
-    # Nearest places preview
-    if places and places[0].get("distance_miles") is not None:
-        nearest_df = pd.DataFrame(places)[["name", "vicinity", "distance_miles"]].copy()
+    # Nearest places preview (places are sorted by distance; only the top 10 are copied)
+    if places["distance_miles"].notna().any():
+        nearest_df = places.head(10)[["name", "vicinity", "distance_miles"]].copy()
         nearest_df["distance_miles"] = nearest_df["distance_miles"].astype(float).round(2)
         st.subheader("Nearest places (distance check)")
-        st.dataframe(nearest_df.head(10), use_container_width=True)
+        st.dataframe(nearest_df, use_container_width=True)
 
     # Reviews + store addresses
     with st.spinner("Collecting reviews + store addresses (Place Details)..."):
         try:
-            results = collect_reviews(client, settings, places)
+            results = cached_reviews(places)
         except Exception as e:
             st.error(f"Failed collecting reviews: {e}")
             st.stop()
@@ -303,7 +313,7 @@ if run_btn:
         st.warning("No reviews returned. Google often returns only a limited set of reviews per place.")
         st.download_button(
             "Download places.csv",
-            places_df.to_csv(index=False).encode("utf-8"),
+            csv_bytes(places_df),
             "places.csv",
             "text/csv",
         )
@@ -394,19 +404,19 @@ if run_btn:
 
     st.download_button(
         "Download places.csv",
-        places_df.to_csv(index=False).encode("utf-8"),
+        csv_bytes(places_df),
         "places.csv",
         "text/csv",
     )
     st.download_button(
         "Download reviews.csv",
-        reviews_df.to_csv(index=False).encode("utf-8"),
+        csv_bytes(reviews_df),
         "reviews.csv",
         "text/csv",
     )
     st.download_button(
         "Download tableau_reviews.csv",
-        tableau_df.to_csv(index=False).encode("utf-8"),
+        csv_bytes(tableau_df),
         "tableau_reviews.csv",
         "text/csv",
     )
@@ -1,5 +1,5 @@
 # src/autocomplete.py
-from typing import List, Dict
+from typing import Dict, List, Optional, Tuple
 from .config import Settings
 from .http_client import HttpClient
 
@@ -31,5 +31,19 @@ def get_place_formatted_address(client: HttpClient, settings: Settings, place_id
         "key": settings.api_key,
     }
     data = client.get_json(PLACE_DETAILS_URL, params=params)
+    status = data.get("status")
+    if status != "OK":
+        raise RuntimeError(f"Place Details (resolve) error: status={status}, msg={data.get('error_message')}")
     result = data.get("result", {}) or {}
     return result
+
+def geocode_address(client: HttpClient, settings: Settings, address: str) -> Tuple[float, float, Optional[str]]:
+    """Returns (lat, lon, formatted_address) for free-text input."""
+    params = {"address": address, "key": settings.api_key}
+    data = client.get_json(settings.geocode_url, params=params)
+    status = data.get("status")
+    if status != "OK":
+        raise RuntimeError(f"Geocode error: status={status}, msg={data.get('error_message')}")
+    loc = data["results"][0]["geometry"]["location"]
+    formatted = data["results"][0].get("formatted_address")
+    return float(loc["lat"]), float(loc["lng"]), formatted
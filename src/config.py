@@ -7,6 +7,8 @@ import os
 class Settings:
     api_key: str
     timeout_sec: int = 20
+    http_pool_connections: int = 8     # keep-alive pools (one per host; all calls hit maps.googleapis.com)
+    http_pool_maxsize: int = 32        # connections per pool; keep >= concurrent worker threads
 
     # Google endpoints
     geocode_url: str = "https://maps.googleapis.com/maps/api/geocode/json"
@@ -18,13 +20,26 @@ class Settings:
     max_nearby_radius_m: int = 50_000  # 50km cap (Google Nearby Search)
     tile_radius_m: int = 40_000        # safe working radius for tiling
     max_pages_per_tile: int = 3        # Nearby Search pages: up to 3 (20 results each)
+    max_concurrent_tiles: int = 8      # tiles fetched in parallel
 
     # Text Search constraints (Brand Search)
     max_pages_textsearch: int = 3      #  (Text Search pages: up to 3)
+    max_concurrent_queries: int = 4    # queries run in parallel (collect_places_textsearch_many)
+
+    # Place Details (reviews)
+    details_workers: int = 8           # Details calls in parallel
+
+    # Distance math
+    fast_trig: bool = False            # polynomial sine in radius filters (< 100 km; <= ~2e-10 relative, < 0.1 mm)
 
     # Rate limiting / token readiness
-    next_page_token_wait_sec: float = 2.2
-    sleep_between_requests_sec: float = 0.15
+    next_page_token_wait_sec: float = 2.2       # Text Search: fixed wait before next page
+    next_page_token_min_wait_sec: float = 1.5   # Nearby Search: first try for next page
+    next_page_token_backoff_sec: float = 0.5    # ...then back off (doubling) while not ready
+    next_page_token_max_retries: int = 4
+    retry_after_max_sec: float = 30.0           # HTTP 429: cap on a server-sent Retry-After
+    max_qps: float = 10.0                       # shared client-side request rate
+    qps_burst: int = 5
 
     # Export paths
     data_raw_dir: str = "data/raw"
@@ -1,10 +1,40 @@
 # src/exporters.py
+import io
 import os
 import pandas as pd
 
+# Optional: pyarrow's CSV writer (ships with streamlit) is much faster than pandas'
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.csv as pacsv  # type: ignore
+except Exception:
+    pa = None
+
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    UTF-8 CSV bytes for downloads; falls back to pandas for columns Arrow can't
+    type (e.g. mixed object columns). The two writers produce the same values
+    but format some of them differently:
+      - pyarrow quotes the header and every string field; pandas quotes only
+        fields that need it
+      - booleans: pyarrow writes true/false, pandas True/False
+      - ints with missing values: pyarrow writes 1, pandas 1.0
+      - datetimes: pyarrow adds microseconds (2024-01-01 00:00:00.000000)
+    Read back with typed columns (e.g. read_csv(..., parse_dates=[...])),
+    both give the same table.
+    """
+    if pa is not None:
+        try:
+            buf = io.BytesIO()
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buf)
+            return buf.getvalue()
+        except pa.ArrowException:
+            pass
+    return df.to_csv(index=False).encode("utf-8")
+
 def export_places_csv(places: list, out_path: str) -> None:
     df = pd.DataFrame(places)
     df.to_csv(out_path, index=False)
@@ -2,8 +2,31 @@
 import math
 from typing import List, Tuple
 
+import numpy as np
+
+# Optional: numexpr fuses the vectorized haversine term into one pass
+try:
+    import numexpr as ne  # type: ignore
+except Exception:
+    ne = None
+
 EARTH_RADIUS_M = 6_371_000.0  # meters
 
+# Scalar haversine constants (CPython won't hoist these per call)
+_DEG2RAD = math.pi / 180.0
+_TWO_R = 2 * EARTH_RADIUS_M
+
+# Below this many points numexpr's setup costs more than numpy's temporaries
+NUMEXPR_MIN_POINTS = 10_000
+
+# equirect_sq_m stays within ~0.1% of haversine up to this latitude
+EQUIRECT_MAX_LAT = 70.0
+
+# fast_trig: polynomial sine for the half-angles, only while they stay tiny.
+# |x| <= 0.1 rad keeps the 3-term Taylor error below ~2e-10 (relative, x^6/5040)
+FAST_TRIG_MAX_RADIUS_M = 100_000
+FAST_TRIG_MAX_ARG = 0.1
+
 
 def miles_to_meters(mi: float) -> float:
     return mi * 1609.344
@@ -13,17 +36,29 @@ def meters_to_miles(m: float) -> float:
     return m / 1609.344
 
 
+def wrap_lon_deg(dlon, out=None):
+    """
+    Longitude difference(s) in degrees wrapped to [-180, 180), so deltas
+    across the antimeridian stay small. Scalars or arrays; out= (an array,
+    may be dlon itself) writes in place.
+    """
+    if out is None:
+        return (dlon + 180.0) % 360.0 - 180.0
+    np.add(dlon, 180.0, out=out)
+    np.remainder(out, 360.0, out=out)
+    out -= 180.0
+    return out
+
+
 def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Great-circle distance between two points in meters."""
-    phi1, phi2 = math.radians(lat1), math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlambda = math.radians(lon2 - lon1)
+    phi1 = lat1 * _DEG2RAD
+    phi2 = lat2 * _DEG2RAD
+    s1 = math.sin((phi2 - phi1) * 0.5)
+    s2 = math.sin((lon2 - lon1) * _DEG2RAD * 0.5)
 
-    a = (
-        math.sin(dphi / 2) ** 2
-        + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
-    )
-    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+    a = s1 * s1 + math.cos(phi1) * math.cos(phi2) * s2 * s2
+    return _TWO_R * math.asin(math.sqrt(a))
 
 
 def haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -31,6 +66,181 @@ def haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float
     return meters_to_miles(haversine_m(lat1, lon1, lat2, lon2))
 
 
+def haversine_vec(lat1: float, lon1: float, lats, lons) -> np.ndarray:
+    """
+    Great-circle distances in meters from one point to arrays of points.
+    Use haversine_m for a single pair (math is faster than numpy there).
+    """
+    return hav_to_m(haversine_a_vec(lat1, lon1, lats, lons))
+
+
+def haversine_a_vec(lat1: float, lon1: float, lats, lons, cos_lats=None, fast_trig: bool = False) -> np.ndarray:
+    """
+    The haversine term a = sin^2(d / 2R) from one point to arrays of points.
+    d is monotonic in a, so radius tests can compare a against
+    radius_to_hav(radius_m) and skip the asin/sqrt for rejected points.
+    cos_lats (cos of lats in radians) can be passed in when the same points
+    are tested repeatedly, so their cosines are computed once.
+    fast_trig swaps sin for a short polynomial; only valid when every
+    half-angle is small (see radius_filter).
+    """
+    lats = np.ascontiguousarray(lats, dtype=np.float64)
+    lons = np.ascontiguousarray(lons, dtype=np.float64)
+
+    phi1 = math.radians(lat1)
+
+    if ne is not None and not fast_trig and cos_lats is None and lats.size >= NUMEXPR_MIN_POINTS:
+        # Single fused loop, no per-op temporary arrays (sin^2 is 2*pi
+        # periodic in dlambda, so no antimeridian wrap needed here)
+        return ne.evaluate(
+            "sin((lats * d2r - phi1) / 2) ** 2"
+            " + cos_phi1 * cos(lats * d2r) * sin((lons - lon1) * d2r / 2) ** 2",
+            local_dict={
+                "lats": lats,
+                "lons": lons,
+                "phi1": phi1,
+                "lon1": float(lon1),
+                "cos_phi1": math.cos(phi1),
+                "d2r": _DEG2RAD,
+            },
+        )
+
+    # In-place ufuncs over contiguous float64: NumPy's SIMD loops, and only
+    # 3 arrays allocated instead of one per operation
+    a = np.radians(lats)
+
+    # cos(phi1) * cos(phi2): cos(phi1) is one scalar call, cos(phi2) may be reused
+    if cos_lats is None:
+        c = np.cos(a)
+        c *= math.cos(phi1)
+    else:
+        c = np.multiply(cos_lats, math.cos(phi1))
+
+    a -= phi1                                   # sin^2(dphi / 2)
+    a *= 0.5
+    _sin(a, fast_trig)
+    a *= a
+
+    s = np.subtract(lons, lon1)                 # sin^2(dlambda / 2); wrapped so
+    wrap_lon_deg(s, out=s)                      # the half-angle stays small (fast_trig)
+    s *= _DEG2RAD * 0.5
+    _sin(s, fast_trig)
+    s *= s
+
+    c *= s
+    a += c
+    return a
+
+
+def _sin(x: np.ndarray, fast_trig: bool) -> None:
+    """In-place sin(x); fast_trig: x * (1 - x^2/6 + x^4/120) for small |x|."""
+    if not fast_trig:
+        np.sin(x, out=x)
+        return
+    x2 = x * x
+    t = x2 * (1.0 / 120.0)
+    np.subtract(1.0 / 6.0, t, out=t)
+    t *= x2
+    np.subtract(1.0, t, out=t)
+    x *= t
+
+
+def radius_to_hav(radius_m: float) -> float:
+    """Haversine term a for a distance in meters (threshold for haversine_a_vec)."""
+    return math.sin(min(radius_m / (2 * EARTH_RADIUS_M), math.pi / 2)) ** 2
+
+
+def hav_to_m(a) -> np.ndarray:
+    """Meters from haversine terms a."""
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+
+def equirect_sq_m(lat1: float, lon1: float, lats, lons) -> np.ndarray:
+    """
+    Squared equirectangular distances (m^2) from one point to arrays of points.
+    Scales longitude by cos of each pair's mean latitude; agrees with
+    haversine to within ~0.1% out to a few hundred km. No asin/sqrt,
+    so it's a cheap radius test: compare against radius**2.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+
+    k = (math.pi / 180.0) * EARTH_RADIUS_M  # meters per degree of latitude
+    dy = (lats - lat1) * k
+    dlon = wrap_lon_deg(lons - lon1)
+    dx = dlon * k * np.cos(np.radians((lats + lat1) / 2))
+    return dx * dx + dy * dy
+
+
+def bbox_half_extent_deg(lat1: float, radius_m: float) -> Tuple[float, float]:
+    """(dlat_max, dlon_max) in degrees of the circle's exact bounding box."""
+    delta = radius_m / EARTH_RADIUS_M  # angular radius
+    dlat_max = math.degrees(delta)
+    s = math.sin(min(delta, math.pi / 2)) / max(0.000001, math.cos(math.radians(lat1)))
+    dlon_max = math.degrees(math.asin(s)) if s < 1.0 else 180.0
+    return dlat_max, dlon_max
+
+
+def bbox_mask(lat1: float, lon1: float, radius_m: float, lats, lons) -> np.ndarray:
+    """
+    True where a point falls inside the lat/lon bounding box of the circle
+    (center, radius_m). Exact bounds, so it never rejects a point inside the
+    circle; use it to skip trig for obvious misses.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+
+    dlat_max, dlon_max = bbox_half_extent_deg(lat1, radius_m)
+    dlon = np.abs(wrap_lon_deg(lons - lon1))
+    return (np.abs(lats - lat1) <= dlat_max) & (dlon <= dlon_max)
+
+
+def radius_filter(
+    lat1: float,
+    lon1: float,
+    radius_m: float,
+    lats,
+    lons,
+    fast_trig: bool = False,
+    prefiltered: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Indices of the points within radius_m of (lat1, lon1), plus their exact
+    great-circle distances in meters. Cheapest rejects first: bounding box,
+    then equirectangular d^2 (1% margin covers its error; skipped when the
+    circle reaches past EQUIRECT_MAX_LAT), then the haversine
+    term against its threshold; asin/sqrt only run for the kept points.
+    fast_trig (opt-in) uses the polynomial sine when the radius is small
+    enough that every half-angle stays under FAST_TRIG_MAX_ARG.
+    prefiltered=True skips the bounding box: the caller already dropped
+    points outside bbox_half_extent_deg.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+
+    if prefiltered:
+        idx = np.arange(lats.size)
+    else:
+        idx = np.flatnonzero(bbox_mask(lat1, lon1, radius_m, lats, lons))
+
+    # The equirectangular error bound only holds away from the poles
+    if abs(lat1) + meters_to_lat_deg(radius_m) <= EQUIRECT_MAX_LAT:
+        d2 = equirect_sq_m(lat1, lon1, lats[idx], lons[idx])
+        idx = idx[d2 <= 1.01 * radius_m * radius_m]
+
+    if fast_trig:
+        # Survivors are within ~radius: |dlambda / 2| <~ r / (2R cos(lat1))
+        cos_lat1 = max(0.000001, math.cos(math.radians(lat1)))
+        fast_trig = (
+            radius_m < FAST_TRIG_MAX_RADIUS_M
+            and 1.01 * radius_m / (2 * EARTH_RADIUS_M * cos_lat1) <= FAST_TRIG_MAX_ARG
+        )
+
+    a = haversine_a_vec(lat1, lon1, lats[idx], lons[idx], fast_trig=fast_trig)
+    inside = a <= radius_to_hav(radius_m)
+    return idx[inside], hav_to_m(a[inside])
+
+
 def meters_to_lat_deg(m: float) -> float:
     """Convert meters to degrees latitude."""
     return (m / EARTH_RADIUS_M) * (180.0 / math.pi)
@@ -63,31 +273,41 @@ def generate_tile_centers(
     lat_extent = meters_to_lat_deg(radius_m)
     lon_extent = meters_to_lon_deg(radius_m, lat)
 
-    centers: List[Tuple[float, float]] = []
-    lat_min, lat_max = lat - lat_extent, lat + lat_extent
-    lon_min, lon_max = lon - lon_extent, lon + lon_extent
-
-    r2 = radius_m * radius_m
-
-    cur_lat = lat_min
-    while cur_lat <= lat_max:
-        cur_lon = lon_min
-        while cur_lon <= lon_max:
-            # keep only grid points inside circle (approx)
-            dy = (cur_lat - lat) * (math.pi / 180.0) * EARTH_RADIUS_M
-            dx = (cur_lon - lon) * (math.pi / 180.0) * EARTH_RADIUS_M * math.cos(
-                math.radians(lat)
-            )
-            if (dx * dx + dy * dy) <= r2:
-                centers.append((cur_lat, cur_lon))
-            cur_lon += dlon
-        cur_lat += dlat
-
-    # Always include center
+    # Same cells, bit for bit, as walking lat_min..lat_max / lon_min..lon_max
+    # with cur += step: cumsum adds sequentially, so cells on the circle's
+    # edge land on the same side of the test
+    grid_lat, grid_lon = np.meshgrid(
+        _walk(lat - lat_extent, lat + lat_extent, dlat),
+        _walk(lon - lon_extent, lon + lon_extent, dlon),
+        indexing="ij",
+    )
+    grid_lat = grid_lat.ravel()
+    grid_lon = grid_lon.ravel()
+
+    # keep only grid points inside circle (equirectangular; same operation
+    # order as the scalar test, for the same rounding)
+    dy = (grid_lat - lat) * (math.pi / 180.0) * EARTH_RADIUS_M
+    dx = (grid_lon - lon) * (math.pi / 180.0) * EARTH_RADIUS_M * math.cos(math.radians(lat))
+    inside = (dx * dx + dy * dy) <= radius_m * radius_m
+
+    # The walk can't repeat a point; only the center may match a
+    # cell (same 5-decimal key), and then it takes that cell's slot
+    centers = list(zip(grid_lat[inside].tolist(), grid_lon[inside].tolist()))
+    key = (round(lat, 5), round(lon, 5))
+    near = np.flatnonzero((np.abs(grid_lat[inside] - lat) < 1e-4) & (np.abs(grid_lon[inside] - lon) < 1e-4))
+    for n in near.tolist():
+        a, b = centers[n]
+        if (round(a, 5), round(b, 5)) == key:
+            centers[n] = (lat, lon)
+            return centers
     centers.append((lat, lon))
+    return centers
+
 
-    # Deduplicate (rounded)
-    uniq = {}
-    for a, b in centers:
-        uniq[(round(a, 5), round(b, 5))] = (a, b)
-    return list(uniq.values())
+def _walk(start: float, stop: float, step: float) -> np.ndarray:
+    """start, start + step, ... <= stop, accumulated like a `+=` loop."""
+    n = int((stop - start) / step) + 3
+    steps = np.full(n, step)
+    steps[0] = start
+    vals = np.cumsum(steps)
+    return vals[vals <= stop]
@@ -1,16 +1,92 @@
 # src/http_client.py
+import json
+import math
+import threading
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Any, Dict, Optional
 
+# Optional: orjson parses response bytes several times faster than json
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: allows bursts of up to `burst` requests,
+    refilled at `rate` tokens per second. acquire() blocks until a token is free.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = float(rate)
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
 class HttpClient:
-    def __init__(self, timeout_sec: int, sleep_sec: float = 0.0):
+    def __init__(
+        self,
+        timeout_sec: int,
+        max_qps: Optional[float] = None,
+        burst: int = 1,
+        max_retries: int = 3,
+        pool_connections: int = 8,
+        pool_maxsize: int = 32,
+        max_retry_wait_sec: float = 30.0,
+    ):
         self.timeout_sec = timeout_sec
-        self.sleep_sec = sleep_sec
+        self.max_retries = max_retries
+        self.max_retry_wait_sec = max_retry_wait_sec
+
+        # Shared across worker threads; None = no client-side throttling
+        self.limiter = TokenBucket(max_qps, burst) if max_qps else None
+
+        # One shared session: keep-alive + a pool big enough for the worker threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def get_json(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        resp = requests.get(url, params=params, timeout=self.timeout_sec)
-        resp.raise_for_status()
-        if self.sleep_sec:
-            time.sleep(self.sleep_sec)
-        return resp.json()
+        attempt = 0
+        while True:
+            if self.limiter:
+                self.limiter.acquire()
+            resp = self.session.get(url, params=params, timeout=self.timeout_sec)
+
+            # Throttled: honor Retry-After (or back off exponentially) and retry
+            if resp.status_code == 429 and attempt < self.max_retries:
+                retry_after = resp.headers.get("Retry-After", "")
+                try:
+                    wait = float(retry_after)
+                except ValueError:
+                    wait = 2.0 ** attempt
+                if not math.isfinite(wait):
+                    wait = 2.0 ** attempt
+                # Negative sleeps raise; huge ones would stall a worker thread
+                time.sleep(min(max(wait, 0.0), self.max_retry_wait_sec))
+                attempt += 1
+                continue
+
+            resp.raise_for_status()
+            # Parse the raw bytes directly (no str decode step)
+            if orjson is not None:
+                return orjson.loads(resp.content)
+            return json.loads(resp.content)
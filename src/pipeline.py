@@ -1,6 +1,5 @@
 # src/pipeline.py
 import os
-import json
 import pandas as pd
 
 from .config import load_settings
@@ -9,20 +8,19 @@ from .geo import miles_to_meters, generate_tile_centers
 from .places_collector import collect_places
 from .reviews_collector import collect_reviews
 from .insights import add_insights
+from .autocomplete import geocode_address
 from .exporters import ensure_dir, export_places_csv, export_reviews_csv, export_tableau_reviews_csv
 
-def geocode_address(client: HttpClient, settings, address: str):
-    params = {"address": address, "key": settings.api_key}
-    data = client.get_json(settings.geocode_url, params=params)
-    status = data.get("status")
-    if status != "OK":
-        raise RuntimeError(f"Geocode error: status={status}, msg={data.get('error_message')}")
-    loc = data["results"][0]["geometry"]["location"]
-    return float(loc["lat"]), float(loc["lng"])
-
 def run():
     settings = load_settings()
-    client = HttpClient(timeout_sec=settings.timeout_sec, sleep_sec=settings.sleep_between_requests_sec)
+    client = HttpClient(
+        timeout_sec=settings.timeout_sec,
+        max_qps=settings.max_qps,
+        burst=settings.qps_burst,
+        pool_connections=settings.http_pool_connections,
+        pool_maxsize=settings.http_pool_maxsize,
+        max_retry_wait_sec=settings.retry_after_max_sec,
+    )
 
     print("\n=== Google Places Review Insights (Tableau-ready) ===\n")
     address = input("Enter a city/address (example: 'Lewisville, TX'): ").strip()
@@ -31,7 +29,7 @@ def run():
     radius_miles = float(input("Enter radius in miles (example: 100): ").strip())
     radius_m = miles_to_meters(radius_miles)
 
-    lat, lon = geocode_address(client, settings, address)
+    lat, lon, _ = geocode_address(client, settings, address)
     print(f"\nGeocoded: {address} -> lat={lat:.5f}, lon={lon:.5f}")
 
     # Tiling (handles big radii like 100 miles)
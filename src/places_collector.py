@@ -1,20 +1,14 @@
 # src/places_collector.py
 import time
-import math
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Set, Tuple, Optional
 
+import numpy as np
+import pandas as pd
+
 from .config import Settings
 from .http_client import HttpClient
-
-EARTH_RADIUS_M = 6371000.0
-
-def haversine_m(lat1, lon1, lat2, lon2) -> float:
-    """Distance in meters."""
-    phi1, phi2 = math.radians(lat1), math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlambda = math.radians(lon2 - lon1)
-    a = math.sin(dphi/2)**2 + math.cos(phi1)*math.cos(phi2)*math.sin(dlambda/2)**2
-    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+from .geo import radius_filter
 
 def nearby_search_tile(
     client: HttpClient,
@@ -33,15 +27,22 @@ def nearby_search_tile(
 
     all_results: List[Dict] = []
     page = 0
+    retries = 0
 
     while True:
         data = client.get_json(settings.nearby_url, params=params)
         status = data.get("status")
 
+        # A fresh next_page_token answers INVALID_REQUEST until Google activates it
+        if status == "INVALID_REQUEST" and "pagetoken" in params and retries < settings.next_page_token_max_retries:
+            time.sleep(settings.next_page_token_backoff_sec * (2 ** retries))
+            retries += 1
+            continue
+
         if status not in ("OK", "ZERO_RESULTS"):
             raise RuntimeError(f"Nearby Search error: status={status}, msg={data.get('error_message')}")
 
-        results = data.get("results", []) or []
+        results = data.get("results") or []
         all_results.extend(results)
 
         token = data.get("next_page_token")
@@ -49,8 +50,9 @@ def nearby_search_tile(
         if not token or page >= settings.max_pages_per_tile:
             break
 
-        time.sleep(settings.next_page_token_wait_sec)
+        time.sleep(settings.next_page_token_min_wait_sec)
         params["pagetoken"] = token
+        retries = 0
 
     return all_results
 
@@ -63,56 +65,74 @@ def collect_places(
     # NEW: true radius filter
     filter_center: Optional[Tuple[float, float]] = None,
     filter_radius_m: Optional[float] = None,
-) -> List[Dict]:
+) -> pd.DataFrame:
     """
-    Returns unique place rows:
-      { place_id, name, vicinity, lat, lon, types, distance_m, distance_miles }
-    If filter_center + filter_radius_m are provided, results are filtered to that radius.
+    Returns a DataFrame of unique places, built column-wise:
+      place_id, name, vicinity, lat, lon, types, distance_m, distance_miles
+    If filter_center + filter_radius_m are provided, results are filtered to that
+    radius and sorted closest first; otherwise distance columns are NaN.
     """
     seen: Set[str] = set()
-    places: List[Dict] = []
 
     c_lat, c_lon = (filter_center if filter_center else (None, None))
-
-    for (lat, lon) in tile_centers:
-        results = nearby_search_tile(client, settings, lat, lon, search_radius_m, keyword)
-
+    use_filter = bool(filter_center) and filter_radius_m is not None
+
+    # Tiles are I/O bound: fetch them concurrently, then merge in tile order
+    def fetch_tile(center: Tuple[float, float]) -> List[Dict]:
+        lat, lon = center
+        return nearby_search_tile(client, settings, lat, lon, search_radius_m, keyword)
+
+    workers = max(1, min(settings.max_concurrent_tiles, len(tile_centers)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        tile_results = list(pool.map(fetch_tile, tile_centers))
+
+    # Dedup across tiles first (tiles overlap), so each place is distance-tested once.
+    # Kept as parallel columns (SoA): pandas builds the frame from them directly.
+    pids: List[str] = []
+    rows: List[Dict] = []
+    lat_list: List[float] = []
+    lon_list: List[float] = []
+    seen_add = seen.add  # local alias for the hot loop
+    for results in tile_results:
         for p in results:
             pid = p.get("place_id")
             if not pid or pid in seen:
                 continue
 
-            geo = p.get("geometry", {}).get("location", {}) or {}
-            p_lat = geo.get("lat")
-            p_lon = geo.get("lng")
+            try:
+                geo = p["geometry"]["location"]
+                p_lat = geo["lat"]
+                p_lon = geo["lng"]
+            except (KeyError, TypeError):
+                continue  # no usable location
             if p_lat is None or p_lon is None:
                 continue
 
-            # Compute distance from chosen center (if provided)
-            dist_m = None
-            dist_miles = None
-            if filter_center and filter_radius_m is not None:
-                dist_m = haversine_m(c_lat, c_lon, p_lat, p_lon)
-                if dist_m > filter_radius_m:
-                    continue  # outside user radius
-                dist_miles = dist_m / 1609.344
-
-            seen.add(pid)
-            places.append({
-                "place_id": pid,
-                "name": p.get("name"),
-                "vicinity": p.get("vicinity"),
-                "lat": p_lat,
-                "lon": p_lon,
-                "types": ",".join(p.get("types", []) or []),
-                "distance_m": dist_m,
-                "distance_miles": dist_miles,
-            })
-
-        time.sleep(settings.sleep_between_requests_sec)
-
-    # Sort by distance when available (closest first)
-    if filter_center and filter_radius_m is not None:
-        places.sort(key=lambda x: (x["distance_m"] is None, x["distance_m"]))
-
-    return places
+            seen_add(pid)
+            pids.append(pid)
+            rows.append(p)
+            lat_list.append(p_lat)
+            lon_list.append(p_lon)
+
+    lats = np.asarray(lat_list, dtype=np.float64)
+    lons = np.asarray(lon_list, dtype=np.float64)
+    dists = np.full(len(pids), np.nan)
+    order = np.arange(len(pids))
+
+    # Distance from chosen center for all unique places in one pass (if provided)
+    if use_filter and pids:
+        keep, kept_dists = radius_filter(c_lat, c_lon, filter_radius_m, lats, lons, fast_trig=settings.fast_trig)
+        dists[keep] = kept_dists
+        order = keep[np.argsort(kept_dists, kind="stable")]  # closest first
+
+    types_join = ",".join
+    return pd.DataFrame({
+        "place_id": [pids[i] for i in order],
+        "name": [rows[i].get("name") for i in order],
+        "vicinity": [rows[i].get("vicinity") for i in order],
+        "lat": lats[order],
+        "lon": lons[order],
+        "types": [types_join(rows[i].get("types") or []) for i in order],
+        "distance_m": dists[order],
+        "distance_miles": dists[order] / 1609.344,
+    })
@@ -1,6 +1,9 @@
 # src/reviews_collector.py
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Union
+
+import pandas as pd
 
 from .config import Settings
 from .http_client import HttpClient
@@ -46,9 +49,10 @@ def fetch_place_details(client: HttpClient, settings: Settings, place_id: str) -
 def collect_reviews(
     client: HttpClient,
     settings: Settings,
-    places: List[Dict],
+    places: Union[pd.DataFrame, List[Dict]],
 ) -> Dict[str, List[Dict]]:
     """
+    places: DataFrame from collect_places, or a list of place dicts.
     Returns:
       places_enriched: list of places with rating + user_ratings_total + full address fields
       reviews: list of normalized review rows (1 row per review) including store address fields
@@ -56,9 +60,20 @@ def collect_reviews(
     places_enriched: List[Dict] = []
     reviews_rows: List[Dict] = []
 
-    for p in places:
+    if isinstance(places, pd.DataFrame):
+        places = [row._asdict() for row in places.itertuples(index=False)]
+
+    # One Place Details call per place: I/O bound, so fetch concurrently
+    # (map keeps the input order)
+    def fetch(p: Dict) -> Dict:
+        return fetch_place_details(client, settings, p["place_id"])
+
+    workers = max(1, min(settings.details_workers, len(places)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        all_details = list(pool.map(fetch, places))
+
+    for p, details in zip(places, all_details):
         pid = p["place_id"]
-        details = fetch_place_details(client, settings, pid)
 
         place_name = details.get("name") or p.get("name")
         avg_rating = details.get("rating")
@@ -1,34 +1,70 @@
 # src/text_search_collector.py
+import copy
+import threading
 import time
-import math
-from typing import Dict, List, Set, Tuple
+from dataclasses import dataclass, replace
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
 
 from .config import Settings
 from .http_client import HttpClient
+from .cache import TTLCache
+from .geo import bbox_half_extent_deg, radius_filter, wrap_lon_deg
 
-EARTH_RADIUS_M = 6371000.0
+# Text Search results for a query are stable minute to minute: skip the
+# 3 round-trips + token waits on repeats. Both caches are read only; copies
+# are made where results leave the module.
+_PAGES_CACHE = TTLCache(maxsize=1024, ttl_sec=600)    # (query, api_key, max_pages) -> raw results
+_PLACES_CACHE = TTLCache(maxsize=1024, ttl_sec=600)   # (query, api_key, max_pages, center, radius, fast_trig) -> places
 
-def haversine_m(lat1, lon1, lat2, lon2) -> float:
-    """Distance in meters."""
-    phi1, phi2 = math.radians(lat1), math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlambda = math.radians(lon2 - lon1)
+_MI_PER_M = 1.0 / 1609.344  # miles per meter (multiply, don't divide)
 
-    a = (
-        math.sin(dphi / 2) ** 2
-        + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
-    )
 
-    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+@dataclass
+class Place:
+    """One Text Search place (slots: no per-record __dict__)."""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10+
+    __slots__ = ("place_id", "name", "vicinity", "lat", "lon", "types", "distance_m")
+
+    place_id: str
+    name: Optional[str]
+    vicinity: Optional[str]
+    lat: float
+    lon: float
+    types: str
+    distance_m: float
 
-def haversine_miles(lat1, lon1, lat2, lon2) -> float:
-    """Distance in miles."""
-    return haversine_m(lat1, lon1, lat2, lon2) / 1609.344
+    @property
+    def distance_miles(self) -> float:
+        return self.distance_m * _MI_PER_M
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "place_id": self.place_id,
+            "name": self.name,
+            "vicinity": self.vicinity,
+            "lat": self.lat,
+            "lon": self.lon,
+            "types": self.types,
+            "distance_m": self.distance_m,
+            "distance_miles": self.distance_miles,
+        }
 
-def text_search_pages(client: HttpClient, settings: Settings, query: str) -> List[Dict]:
+
+def iter_text_search_pages(
+    client: HttpClient,
+    settings: Settings,
+    query: str,
+    stop_event: Optional[threading.Event] = None,
+) -> Iterator[Dict]:
+    """
+    Yields raw Text Search results page by page as they arrive (uncached).
+    Setting stop_event interrupts the page-token wait and ends the run early.
+    """
     params = {"query": query, "key": settings.api_key}
-    all_results: List[Dict] = []
     page = 0
 
     while True:
@@ -38,18 +74,45 @@ def text_search_pages(client: HttpClient, settings: Settings, query: str) -> Lis
         if status not in ("OK", "ZERO_RESULTS"):
             raise RuntimeError(f"Text Search error: status={status}, msg={data.get('error_message')}")
 
-        results = data.get("results", []) or []
-        all_results.extend(results)
+        yield from data.get("results") or []
 
         token = data.get("next_page_token")
+        del data  # drop the page before the token wait / next request
         page += 1
         if not token or page >= settings.max_pages_textsearch:
             break
 
-        time.sleep(settings.next_page_token_wait_sec)
+        if stop_event is None:
+            time.sleep(settings.next_page_token_wait_sec)
+        elif stop_event.wait(settings.next_page_token_wait_sec):
+            return
         params["pagetoken"] = token
 
-    return all_results
+
+def _pages(
+    client: HttpClient,
+    settings: Settings,
+    query: str,
+    stop_event: Optional[threading.Event] = None,
+) -> List[Dict]:
+    """Raw results for query, from _PAGES_CACHE when possible. Shared: read only."""
+    key = (query, settings.api_key, settings.max_pages_textsearch)
+    results = _PAGES_CACHE.get(key)
+    if results is None:
+        results = list(iter_text_search_pages(client, settings, query, stop_event=stop_event))
+        if stop_event is None or not stop_event.is_set():  # partial runs aren't cached
+            _PAGES_CACHE.set(key, results)
+    return results
+
+
+def text_search_pages(
+    client: HttpClient,
+    settings: Settings,
+    query: str,
+    stop_event: Optional[threading.Event] = None,
+) -> List[Dict]:
+    """Full Text Search results for query (cached; callers get their own copies)."""
+    return copy.deepcopy(_pages(client, settings, query, stop_event=stop_event))
 
 
 def collect_places_textsearch(
@@ -58,39 +121,136 @@ def collect_places_textsearch(
     query: str,
     filter_center: Tuple[float, float],
     filter_radius_m: float,
-) -> List[Dict]:
+    stop_event: Optional[threading.Event] = None,
+) -> List[Place]:
     c_lat, c_lon = filter_center
-    raw = text_search_pages(client, settings, query=query)
 
+    # Rounded center (~1 m) so re-resolving the same address still hits
+    key = (
+        query,
+        settings.api_key,
+        settings.max_pages_textsearch,
+        round(c_lat, 5),
+        round(c_lon, 5),
+        int(filter_radius_m),
+        settings.fast_trig,
+    )
+    cached = _PLACES_CACHE.get(key)
+    if cached is None:
+        # _filter_textsearch only reads the results: no copy needed
+        raw = _pages(client, settings, query, stop_event=stop_event)
+        cached = _filter_textsearch(raw, c_lat, c_lon, filter_radius_m, fast_trig=settings.fast_trig)
+        if stop_event is None or not stop_event.is_set():
+            _PLACES_CACHE.set(key, cached)
+    return [replace(p) for p in cached]
+
+
+def _filter_textsearch(
+    raw: Iterable[Dict],
+    c_lat: float,
+    c_lon: float,
+    filter_radius_m: float,
+    fast_trig: bool = False,
+) -> List[Place]:
+    """Unique places from raw Text Search results within the radius, closest first."""
     seen: Set[str] = set()
-    places: List[Dict] = []
+    places: List[Place] = []
 
+    # One pass over the results: dedup (cheapest reject, so repeated
+    # place_ids never reach the distance math), extract the location, drop
+    # points outside the circle's bounding box, and stage survivors as
+    # parallel columns (SoA). Hot-loop lookups are bound to locals.
+    dlat_max, dlon_max = bbox_half_extent_deg(c_lat, filter_radius_m)
+    pids: List[str] = []
+    rows: List[Dict] = []
+    lat_list: List[float] = []
+    lon_list: List[float] = []
+    seen_add = seen.add
+    pids_append = pids.append
+    rows_append = rows.append
+    lat_append = lat_list.append
+    lon_append = lon_list.append
     for p in raw:
         pid = p.get("place_id")
         if not pid or pid in seen:
             continue
 
-        geo = p.get("geometry", {}).get("location", {}) or {}
-        p_lat = geo.get("lat")
-        p_lon = geo.get("lng")
+        try:
+            geo = p["geometry"]["location"]
+            p_lat = geo["lat"]
+            p_lon = geo["lng"]
+        except (KeyError, TypeError):
+            continue  # no usable location
         if p_lat is None or p_lon is None:
             continue
 
-        dist_m = haversine_m(c_lat, c_lon, p_lat, p_lon)
-        if dist_m > filter_radius_m:
+        seen_add(pid)
+        if abs(p_lat - c_lat) > dlat_max or abs(wrap_lon_deg(p_lon - c_lon)) > dlon_max:
             continue
 
-        seen.add(pid)
-        places.append({
-            "place_id": pid,
-            "name": p.get("name"),
-            "vicinity": p.get("formatted_address") or p.get("vicinity"),
-            "lat": p_lat,
-            "lon": p_lon,
-            "types": ",".join(p.get("types", []) or []),
-            "distance_m": dist_m,
-            "distance_miles": dist_m / 1609.344,
-        })
-
-    places.sort(key=lambda x: x["distance_m"])
+        pids_append(pid)
+        rows_append(p)
+        lat_append(p_lat)
+        lon_append(p_lon)
+
+    if not pids:
+        return places
+
+    # One vectorized radius filter (equirectangular -> haversine; the bbox
+    # was applied above); order survivors closest first, then build records
+    # only for those
+    lats = np.asarray(lat_list, dtype=np.float64)
+    lons = np.asarray(lon_list, dtype=np.float64)
+    keep, dists = radius_filter(
+        c_lat, c_lon, filter_radius_m, lats, lons, fast_trig=fast_trig, prefiltered=True
+    )
+    order = np.argsort(dists, kind="stable")
+
+    for j in order.tolist():
+        i = int(keep[j])
+        p = rows[i]
+        types_list = p.get("types")
+        places.append(Place(
+            place_id=pids[i],
+            name=p.get("name"),
+            vicinity=p.get("formatted_address") or p.get("vicinity"),
+            lat=lat_list[i],
+            lon=lon_list[i],
+            types=",".join(types_list) if types_list else "",
+            distance_m=float(dists[j]),
+        ))
+
     return places
+
+
+def collect_places_textsearch_many(
+    client: HttpClient,
+    settings: Settings,
+    queries: Sequence[str],
+    filter_center: Tuple[float, float],
+    filter_radius_m: float,
+    stop_event: Optional[threading.Event] = None,
+) -> List[Place]:
+    """
+    Runs several Text Search queries concurrently (each query's page-token
+    waits overlap with the others) and merges them: unique by place_id
+    (first query wins), sorted by distance. Setting stop_event lets every
+    worker stop at its next page-token wait.
+    """
+    def run(query: str) -> List[Place]:
+        return collect_places_textsearch(client, settings, query, filter_center, filter_radius_m, stop_event=stop_event)
+
+    workers = max(1, min(settings.max_concurrent_queries, len(queries)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        per_query = list(pool.map(run, queries))
+
+    seen: Set[str] = set()
+    merged: List[Place] = []
+    for places in per_query:
+        for p in places:
+            if p.place_id not in seen:
+                seen.add(p.place_id)
+                merged.append(p)
+
+    merged.sort(key=attrgetter("distance_m"))  # C-level key, no lambda call per item
+    return merged
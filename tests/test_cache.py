@@ -0,0 +1,28 @@
+# tests/test_cache.py
+from types import SimpleNamespace
+
+from src import cache
+from src.cache import TTLCache
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    clock = SimpleNamespace(now=100.0)
+    monkeypatch.setattr(cache, "time", SimpleNamespace(monotonic=lambda: clock.now))
+
+    c = TTLCache(maxsize=4, ttl_sec=10)
+    c.set("a", 1)
+    clock.now += 9.5
+    assert c.get("a") == 1
+    clock.now += 1.0
+    assert c.get("a") is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    c = TTLCache(maxsize=2, ttl_sec=600)
+    c.set("a", 1)
+    c.set("b", 2)
+    assert c.get("a") == 1  # "b" is now the oldest
+    c.set("c", 3)
+    assert c.get("b") is None
+    assert c.get("a") == 1
+    assert c.get("c") == 3
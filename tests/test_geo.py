@@ -0,0 +1,77 @@
+# tests/test_geo.py
+import numpy as np
+
+import pytest
+
+from src.geo import (
+    bbox_mask,
+    generate_tile_centers,
+    haversine_m,
+    miles_to_meters,
+    radius_filter,
+    wrap_lon_deg,
+)
+
+
+def test_radius_filter_across_antimeridian():
+    # Same circle, points on both sides of +/-180
+    lat1, lon1, radius_m = -16.8, 179.9, 20_000
+    lats = [-16.8, -16.8, -16.75, -16.8]
+    lons = [-179.95, 179.85, -179.99, -179.5]  # last one is ~43 km away
+
+    expected = [haversine_m(lat1, lon1, a, b) for a, b in zip(lats, lons)]
+    for fast_trig in (False, True):
+        idx, dists = radius_filter(lat1, lon1, radius_m, lats, lons, fast_trig=fast_trig)
+        assert idx.tolist() == [0, 1, 2]
+        assert np.allclose(dists, expected[:3])
+
+    # Center just west of the antimeridian, points just east of it
+    idx, _ = radius_filter(10.0, -179.95, 20_000, [10.0, 10.0], [179.95, 179.9])
+    assert idx.tolist() == [0, 1]
+
+
+def test_radius_filter_prefiltered_matches_full():
+    rng = np.random.default_rng(0)
+    lats = rng.uniform(32.0, 34.0, 500)
+    lons = rng.uniform(-98.0, -96.0, 500)
+    full_idx, full_d = radius_filter(33.0, -97.0, 50_000, lats, lons)
+
+    in_box = bbox_mask(33.0, -97.0, 50_000, lats, lons)
+    idx, d = radius_filter(33.0, -97.0, 50_000, lats[in_box], lons[in_box], prefiltered=True)
+    assert np.flatnonzero(in_box)[idx].tolist() == full_idx.tolist()
+    assert np.array_equal(d, full_d)
+
+
+# Baseline tile lists (pinned to 6 decimals)
+@pytest.mark.parametrize(
+    "lat, lon, radius_m, expected",
+    [
+        (33.0, -97.0, 30_000, [(33.0, -97.0)]),
+        (33.0, -97.0, miles_to_meters(30), [(33.105398, -96.874328), (33.0, -97.0)]),
+        # A grid cell lands on the center: the center takes that cell's slot
+        (33.0, -97.0, 60_000, [
+            (32.460407, -97.0), (33.0, -97.643391), (33.0, -97.0),
+            (33.0, -96.356609), (33.539593, -97.0),
+        ]),
+        (47.6, -122.3, miles_to_meters(50), [
+            (47.415934, -122.572972), (47.415934, -121.772748),
+            (47.955527, -122.572972), (47.955527, -121.772748), (47.6, -122.3),
+        ]),
+    ],
+)
+def test_generate_tile_centers_pinned(lat, lon, radius_m, expected):
+    centers = generate_tile_centers(lat, lon, radius_m, 40_000)
+    assert [(round(a, 6), round(b, 6)) for a, b in centers] == expected
+    assert (lat, lon) in centers  # the exact center, not a rounded grid cell
+
+
+def test_wrap_lon_deg_scalar_array_and_in_place():
+    assert wrap_lon_deg(359.9) == pytest.approx(-0.1)
+    assert wrap_lon_deg(-359.9) == pytest.approx(0.1)
+    assert wrap_lon_deg(180.0) == -180.0
+
+    d = np.array([0.1 - 179.9, 179.9 - (-179.9), 10.0])
+    expected = [-179.8, -0.2, 10.0]
+    assert np.allclose(wrap_lon_deg(d), expected)
+    assert wrap_lon_deg(d, out=d) is d
+    assert np.allclose(d, expected)
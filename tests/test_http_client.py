@@ -0,0 +1,83 @@
+# tests/test_http_client.py
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from src import http_client
+from src.http_client import HttpClient, TokenBucket
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None, content=b'{"status": "OK"}'):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = content
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}")
+
+
+class FakeSession:
+    """Returns the queued responses in order."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def get(self, url, params=None, timeout=None):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    waits = []
+    monkeypatch.setattr(http_client.time, "sleep", waits.append)
+    return waits
+
+
+def make_client(responses, **kwargs):
+    client = HttpClient(timeout_sec=5, max_retry_wait_sec=30.0, **kwargs)
+    client.session = FakeSession(responses)
+    return client
+
+
+@pytest.mark.parametrize(
+    "retry_after, expected_wait",
+    [
+        ("-1", 0.0),          # negative: clamped, time.sleep would raise
+        ("abc", 1.0),         # not a number: exponential backoff (2 ** 0)
+        ("nan", 1.0),
+        ("1e9", 30.0),        # oversized: capped at max_retry_wait_sec
+        ("2.5", 2.5),
+    ],
+)
+def test_429_retry_after_is_clamped(sleeps, retry_after, expected_wait):
+    client = make_client([FakeResponse(429, {"Retry-After": retry_after}), FakeResponse(200)])
+    assert client.get_json("https://example.test", {}) == {"status": "OK"}
+    assert sleeps == [expected_wait]
+
+
+def test_429_gives_up_after_max_retries(sleeps):
+    client = make_client([FakeResponse(429)] * 4, max_retries=3)
+    with pytest.raises(requests.HTTPError):
+        client.get_json("https://example.test", {})
+    assert client.session.calls == 4
+    assert sleeps == [1.0, 2.0, 4.0]
+
+
+def test_token_bucket_bursts_then_waits(monkeypatch):
+    clock = SimpleNamespace(now=0.0)
+    waits = []
+
+    def sleep(sec):
+        waits.append(sec)
+        clock.now += sec
+
+    monkeypatch.setattr(http_client, "time", SimpleNamespace(monotonic=lambda: clock.now, sleep=sleep))
+    bucket = TokenBucket(rate=10.0, burst=2)
+    for _ in range(3):
+        bucket.acquire()
+    assert waits == [pytest.approx(0.1)]  # third token: 1 / rate
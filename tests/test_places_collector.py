@@ -0,0 +1,52 @@
+# tests/test_places_collector.py
+import pytest
+
+from src import places_collector
+from src.config import Settings
+from src.places_collector import nearby_search_tile
+
+
+class FakeClient:
+    """Returns the queued Nearby Search payloads in order, recording params."""
+
+    def __init__(self, payloads):
+        self.payloads = list(payloads)
+        self.params = []
+
+    def get_json(self, url, params):
+        self.params.append(dict(params))
+        return self.payloads.pop(0)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(places_collector.time, "sleep", lambda sec: None)
+
+
+def test_invalid_request_retried_only_with_pagetoken():
+    settings = Settings(api_key="k", next_page_token_max_retries=2)
+    client = FakeClient([
+        {"status": "OK", "results": [{"place_id": "a"}], "next_page_token": "t"},
+        {"status": "INVALID_REQUEST"},  # token not active yet
+        {"status": "OK", "results": [{"place_id": "b"}]},
+    ])
+    results = nearby_search_tile(client, settings, 33.0, -97.0, 1000, "tacos")
+    assert [p["place_id"] for p in results] == ["a", "b"]
+    assert [p.get("pagetoken") for p in client.params] == [None, "t", "t"]
+
+    # First page: INVALID_REQUEST is a real error, no retry
+    client = FakeClient([{"status": "INVALID_REQUEST", "error_message": "bad"}])
+    with pytest.raises(RuntimeError, match="INVALID_REQUEST"):
+        nearby_search_tile(client, settings, 33.0, -97.0, 1000, "tacos")
+    assert len(client.params) == 1
+
+
+def test_invalid_request_gives_up_after_max_retries():
+    settings = Settings(api_key="k", next_page_token_max_retries=2)
+    client = FakeClient(
+        [{"status": "OK", "results": [], "next_page_token": "t"}]
+        + [{"status": "INVALID_REQUEST"}] * 3
+    )
+    with pytest.raises(RuntimeError, match="INVALID_REQUEST"):
+        nearby_search_tile(client, settings, 33.0, -97.0, 1000, "tacos")
+    assert len(client.params) == 4
@@ -0,0 +1,86 @@
+# tests/test_text_search_collector.py
+from dataclasses import replace
+
+import pytest
+
+from src import text_search_collector as tsc
+from src.config import Settings
+
+
+class FakeClient:
+    """One Text Search page per query; counts get_json calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_json(self, url, params):
+        self.calls += 1
+        return {
+            "status": "OK",
+            "results": [
+                {
+                    "place_id": "near",
+                    "name": "Near",
+                    "formatted_address": "1 Main St",
+                    "geometry": {"location": {"lat": 33.0, "lng": -97.0}},
+                    "types": ["restaurant", "food"],
+                    "rating": 4.5,
+                },
+                {
+                    "place_id": "far",
+                    "name": "Far",
+                    "geometry": {"location": {"lat": 34.0, "lng": -97.0}},
+                },
+            ],
+        }
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    tsc._PAGES_CACHE.clear()
+    tsc._PLACES_CACHE.clear()
+    yield
+    tsc._PAGES_CACHE.clear()
+    tsc._PLACES_CACHE.clear()
+
+
+def test_pages_then_places_fetch_once():
+    client, settings = FakeClient(), Settings(api_key="k")
+
+    results = tsc.text_search_pages(client, settings, "tacos")
+    assert results[0]["rating"] == 4.5  # full results, not trimmed
+    places = tsc.collect_places_textsearch(client, settings, "tacos", (33.0, -97.0), 10_000)
+    assert [p.place_id for p in places] == ["near"]
+    assert places[0].types == "restaurant,food"
+    assert client.calls == 1
+
+    tsc.text_search_pages(client, settings, "tacos")
+    assert client.calls == 1
+
+
+def test_caller_mutations_do_not_reach_the_cache():
+    client, settings = FakeClient(), Settings(api_key="k")
+
+    results = tsc.text_search_pages(client, settings, "tacos")
+    results[0]["geometry"]["location"]["lat"] = 0.0
+    results.clear()
+    assert tsc.text_search_pages(client, settings, "tacos")[0]["geometry"]["location"]["lat"] == 33.0
+
+    places = tsc.collect_places_textsearch(client, settings, "tacos", (33.0, -97.0), 10_000)
+    places[0].name = "Changed"
+    places.clear()
+    again = tsc.collect_places_textsearch(client, settings, "tacos", (33.0, -97.0), 10_000)
+    assert [p.name for p in again] == ["Near"]
+    assert client.calls == 1
+
+
+def test_cache_keys_include_output_settings():
+    client, settings = FakeClient(), Settings(api_key="k")
+    tsc.collect_places_textsearch(client, settings, "tacos", (33.0, -97.0), 10_000)
+
+    tsc.collect_places_textsearch(client, replace(settings, fast_trig=True), "tacos", (33.0, -97.0), 10_000)
+    assert client.calls == 1  # same pages, places re-filtered
+    assert len(tsc._PLACES_CACHE._data) == 2
+
+    tsc.collect_places_textsearch(client, replace(settings, max_pages_textsearch=1), "tacos", (33.0, -97.0), 10_000)
+    assert client.calls == 2